@@ -10,6 +10,7 @@ from django import forms
 from django.contrib import admin
 from django.contrib.admin import helpers
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count
 from polymorphic.admin import (PolymorphicInlineSupportMixin,
                                StackedPolymorphicInline)
 
@@ -149,10 +150,15 @@ class FormAdmin(PolymorphicInlineSupportMixin, admin.ModelAdmin):
     # Allow "Save as new" for quick duplication of forms
     save_as = True
 
+    def get_queryset(self, request):
+        # Count the fields in the changelist query rather than once per row
+        return super().get_queryset(request).annotate(_n_fields=Count("field"))
+
     def n_fields(self, obj):
-        return obj.fields.count()
+        return obj._n_fields
 
     n_fields.short_description = "# fields"
+    n_fields.admin_order_field = "_n_fields"
 
 
 ################################################################################
@@ -185,7 +191,8 @@ class HasMetadataModelAdmin(admin.ModelAdmin):
         """
         ctype = ContentType.objects.get_for_model(obj)
         metadata = Metadatum.objects.filter(content_type=ctype, object_id=obj.pk)
-        return {d.key: d.value for d in metadata.all()}
+        # Only fetch the two columns we need rather than full model instances
+        return dict(metadata.values_list("key", "value"))
 
     def save_model(self, request, obj, form, change):
         #####
@@ -248,7 +255,7 @@ class HasMetadataModelAdmin(admin.ModelAdmin):
         metadata_admin_form = helpers.AdminForm(
             metadata_form,
             # Put all the fields in one fieldset
-            [(None, {"fields": list(metadata_form.fields.keys())})],
+            [(None, {"fields": tuple(metadata_form.fields)})],
             # No pre-populated fields
             {},
         )
@@ -349,7 +356,7 @@ class HasMetadataModelAdmin(admin.ModelAdmin):
                 context["metadata_form"] = helpers.AdminForm(
                     metadata_form,
                     # Put all the fields in one fieldset
-                    [("Metadata", {"fields": list(metadata_form.fields.keys())})],
+                    [("Metadata", {"fields": tuple(metadata_form.fields)})],
                     # No pre-populated fields
                     {},
                 )
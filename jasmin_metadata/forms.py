@@ -7,6 +7,7 @@ __copyright__ = "Copyright 2015 UK Science and Technology Facilities Council"
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 
 from .models import Metadatum
 
@@ -25,9 +26,20 @@ class MetadataForm(forms.Form):
             The object must be saved before calling this method.
         """
         content_type = ContentType.objects.get_for_model(obj)
-        # Remove any existing metadata for the object
-        Metadatum.objects.filter(content_type=content_type, object_id=obj.pk).delete()
-        for key, value in self.cleaned_data.items():
-            Metadatum.objects.create(
-                content_type=content_type, object_id=obj.pk, key=key, value=value
+        with transaction.atomic():
+            # Remove any existing metadata for the object
+            Metadatum.objects.filter(
+                content_type=content_type, object_id=obj.pk
+            ).delete()
+            # Insert the new entries in a single batched statement
+            Metadatum.objects.bulk_create(
+                [
+                    Metadatum(
+                        content_type=content_type,
+                        object_id=obj.pk,
+                        key=key,
+                        value=value,
+                    )
+                    for key, value in self.cleaned_data.items()
+                ]
             )
@@ -8,8 +8,7 @@ __copyright__ = "Copyright 2015 UK Science and Technology Facilities Council"
 from django.contrib.contenttypes.fields import (GenericForeignKey,
                                                 GenericRelation)
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connections, models, router, transaction
 from picklefield.fields import PickledObjectField
 
 
@@ -61,13 +60,51 @@ class HasMetadata(models.Model):
         Finds all metadata entries associated with this object and copies them
         onto the given object.
         """
-        content_type = ContentType.objects.get_for_model(obj)
-        # Remove any existing metadata for the object
-        Metadatum.objects.filter(content_type=content_type, object_id=obj.pk).delete()
-        for datum in self.metadata.all():
-            Metadatum.objects.create(
-                content_type=content_type,
-                object_id=obj.pk,
-                key=datum.key,
-                value=datum.value,
-            )
+        if self.pk is None or obj.pk is None:
+            raise ValueError("Metadata can only be copied between saved objects")
+        using = router.db_for_write(Metadatum, instance=obj)
+        content_type = ContentType.objects.db_manager(using).get_for_model(obj)
+        with transaction.atomic(using=using):
+            # Remove any existing metadata for the object
+            Metadatum.objects.using(using).filter(
+                content_type=content_type, object_id=obj.pk
+            ).delete()
+            if self._state.db == using:
+                # Copy the stored values directly in the database so that they
+                # don't have to be unpickled and pickled again
+                self._copy_metadata_in_database(content_type, obj, using)
+            else:
+                # The source metadata is in a different database, so read it
+                # through the ORM and insert it in a single batch
+                Metadatum.objects.using(using).bulk_create(
+                    [
+                        Metadatum(
+                            content_type=content_type,
+                            object_id=obj.pk,
+                            key=key,
+                            value=value,
+                        )
+                        for key, value in self.metadata.values_list("key", "value")
+                    ],
+                    batch_size=500,
+                )
+
+    def _copy_metadata_in_database(self, content_type, obj, using):
+        connection = connections[using]
+        quote_name = connection.ops.quote_name
+        columns = [
+            quote_name(Metadatum._meta.get_field(name).column)
+            for name in ("content_type", "object_id", "key", "value")
+        ]
+        sql = (
+            "INSERT INTO {table} ({0}, {1}, {2}, {3}) "
+            "SELECT %s, %s, {2}, {3} FROM {table} WHERE {0} = %s AND {1} = %s"
+        ).format(*columns, table=quote_name(Metadatum._meta.db_table))
+        params = [
+            content_type.pk,
+            str(obj.pk),
+            ContentType.objects.db_manager(using).get_for_model(self).pk,
+            str(self.pk),
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
@@ -11,7 +11,6 @@ from collections import OrderedDict
 from ipaddress import IPv4Address
 
 from django import forms
-from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.validators import RegexValidator
 from django.db import models